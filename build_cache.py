@@ -0,0 +1,134 @@
+# Offline build of the summary bundle the Streamlit app reads at startup.
+# Re-run after changing the dataset:
+#   python build_cache.py
+import hashlib
+import pickle
+from collections import Counter
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pandas as pd
+
+try:
+    from numba import njit
+except ImportError:  # optional, token counting falls back to Arrow kernels
+    njit = None
+
+DATA_PATH = 'data/anxiety_preprocessed.csv'
+BUNDLE_PATH = 'data/app_cache.pkl'
+# Term frequencies follow the report: counted over the first 1,000 posts,
+# without "cannot", which is left behind by expanding "can't"
+TOP_TERMS_SAMPLE = 1000
+EXCLUDED_TERMS = {'cannot'}
+
+if njit is not None:
+    # Same whitespace set as str.isspace(), decoded from UTF-8 code points
+    @njit(cache=True, inline='always')
+    def _is_space(cp):
+        return (cp == 32 or 9 <= cp <= 13 or 28 <= cp <= 31 or cp == 0x85
+                or cp == 0xA0 or cp == 0x1680 or 0x2000 <= cp <= 0x200A
+                or cp == 0x2028 or cp == 0x2029 or cp == 0x202F
+                or cp == 0x205F or cp == 0x3000)
+
+    # Counts whitespace-separated runs straight off an Arrow string array's
+    # data buffer and offsets. Serial on purpose: parallel=True gains little at
+    # this size and its threading layer is awkward to run under Streamlit
+    @njit(cache=True)
+    def _count_tokens_kernel(buf, offsets, out):
+        for i in range(len(out)):
+            j = offsets[i]
+            end = offsets[i + 1]
+            count = 0
+            in_token = False
+            while j < end:
+                b = buf[j]
+                if b < 0x80:
+                    cp = b
+                    j += 1
+                elif b < 0xE0:
+                    cp = ((b & 0x1F) << 6) | (buf[j + 1] & 0x3F)
+                    j += 2
+                elif b < 0xF0:
+                    cp = ((b & 0x0F) << 12) | ((buf[j + 1] & 0x3F) << 6) | (buf[j + 2] & 0x3F)
+                    j += 3
+                else:
+                    # 4-byte sequences are never whitespace
+                    cp = 0x10000
+                    j += 4
+                if _is_space(cp):
+                    in_token = False
+                elif not in_token:
+                    in_token = True
+                    count += 1
+            out[i] = count
+
+# Whitespace token count per row, equivalent to str.split() but done with
+# Numba or Arrow kernels so no per-row Python list is built
+def count_tokens(series):
+    arr = pa.array(series.fillna(''), type=pa.large_string())
+    if njit is not None:
+        _, offsets, data = arr.buffers()
+        offsets = np.frombuffer(offsets, dtype=np.int64)[arr.offset:arr.offset + len(arr) + 1]
+        buf = np.frombuffer(data, dtype=np.uint8) if data is not None else np.zeros(0, dtype=np.uint8)
+        counts = np.empty(len(arr), dtype=np.int64)
+        _count_tokens_kernel(buf, offsets, counts)
+    else:
+        pieces = pc.utf8_split_whitespace(arr)
+        # Leading/trailing whitespace yields empty pieces that split() would drop
+        non_empty = pc.greater(pc.utf8_length(pc.list_flatten(pieces)), 0)
+        rows = pc.filter(pc.list_parent_indices(pieces), non_empty).to_numpy()
+        counts = np.bincount(rows, minlength=len(arr))
+    # Smallest integer dtype that fits (int16 for this corpus)
+    return pd.to_numeric(counts, downcast='integer')
+
+# Five-number summary with Tukey fences, so the box plot ships a handful of
+# statistics and a capped sample of outliers instead of every post's count
+def box_summary(counts, max_outliers=500):
+    q1, median, q3 = np.quantile(counts, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    inside = counts[(counts >= q1 - 1.5 * iqr) & (counts <= q3 + 1.5 * iqr)]
+    outliers = counts[(counts < inside.min()) | (counts > inside.max())]
+    if len(outliers) > max_outliers:
+        rng = np.random.default_rng(0)
+        outliers = rng.choice(outliers, max_outliers, replace=False)
+    # Plain floats and a tuple so the summary can key the app's cached figure
+    return (float(q1), float(median), float(q3),
+            float(inside.min()), float(inside.max()), tuple(outliers.tolist()))
+
+# Content hash of the source data, stored in the bundle so the app can tell
+# when the CSV has changed since the last build
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def build_bundle(df):
+    # Empty selftext counts as 0 tokens, but posts with no stemmed tokens at
+    # all are left out of the processed stats, as str.split().str.len() did
+    original_tokens = count_tokens(df['original_selftext'])
+    processed_tokens = count_tokens(df['tokens_stemmed'].dropna())
+
+    terms = Counter()
+    df['tokens_stemmed'].head(TOP_TERMS_SAMPLE).dropna().str.split().apply(terms.update)
+    for term in EXCLUDED_TERMS:
+        del terms[term]
+
+    return {
+        'num_posts': len(df),
+        'original_box': box_summary(original_tokens),
+        'processed_box': box_summary(processed_tokens),
+        'avg_original': float(original_tokens.mean()),
+        'avg_processed': float(processed_tokens.mean()),
+        'top_terms': dict(terms.most_common(15))
+    }
+
+if __name__ == '__main__':
+    df = pd.read_csv(DATA_PATH, usecols=['original_selftext', 'tokens_stemmed'])
+    bundle = build_bundle(df)
+    bundle['source_sha256'] = file_sha256(DATA_PATH)
+    with open(BUNDLE_PATH, 'wb') as f:
+        pickle.dump(bundle, f)
+    print(f"Wrote {BUNDLE_PATH} ({bundle['num_posts']:,} posts)")
@@ -1,9 +1,114 @@
+import hashlib
+import os
+import pickle
+
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from collections import Counter
-import re
+
+# Static report content
+STEPS = [
+    {
+        "step": "1. Lowercasing",
+        "purpose": "Convert all text to lowercase for consistency",
+        "example": "I'm Having ANXIETY → i'm having anxiety",
+        "impact": "Ensures 'Anxiety' and 'anxiety' are treated as same word"
+    },
+    {
+        "step": "2. Contraction Expansion",
+        "purpose": "Expand contractions for better analysis",
+        "example": "don't → do not, it's → it is",
+        "impact": "Found in 47.2% of posts"
+    },
+    {
+        "step": "3. URL/Email Removal",
+        "purpose": "Remove web links and email addresses",
+        "example": "Check https://example.com → Check [URL]",
+        "impact": "Found in 1.8% of posts"
+    },
+    {
+        "step": "4. Number Normalization",
+        "purpose": "Replace numbers with placeholder token",
+        "example": "3 years ago → NUM years ago",
+        "impact": "Found in 46.7% of posts"
+    },
+    {
+        "step": "5. Punctuation Removal",
+        "purpose": "Remove excessive punctuation",
+        "example": "Help!!! → Help.",
+        "impact": "Found in 18.8% of posts"
+    },
+    {
+        "step": "6. Whitespace Normalization",
+        "purpose": "Remove extra spaces and newlines",
+        "example": "text    with    spaces → text with spaces",
+        "impact": "Ensures consistent spacing"
+    },
+    {
+        "step": "7. Tokenization",
+        "purpose": "Split text into individual words",
+        "example": "I have anxiety → ['I', 'have', 'anxiety']",
+        "impact": "Essential for word-level analysis"
+    },
+    {
+        "step": "8. Stopword Removal",
+        "purpose": "Remove common words with little meaning",
+        "example": "I have the anxiety → ['anxiety']",
+        "impact": "Reduced token count by 53.3%"
+    },
+    {
+        "step": "9. Stemming",
+        "purpose": "Reduce words to root form",
+        "example": "running, runs → run",
+        "impact": "Groups related words together"
+    }
+]
+
+PREPROCESSING_STATS = {
+    'Contractions': 47.2,
+    'Numbers': 46.7,
+    'Excessive Punctuation': 18.8,
+    'URLs': 1.8
+}
+
+EXAMPLES = [
+    {
+        "title": "Example 1: Contraction Expansion & Number Normalization",
+        "original": "I'm going to give my 2 months notice to my employer today. It's a great company, but it just isn't a fit and I'm miserable at my current position.",
+        "processed": "going give num month notice employer today great company fit miserable current position"
+    },
+    {
+        "title": "Example 2: Stopword Removal & Stemming",
+        "original": "I got fired at my sidejob at a retail store, I had no previous experience with a retail job.",
+        "processed": "got fir sidejob retail store previous experience retail job"
+    },
+    {
+        "title": "Example 3: Punctuation & Whitespace Normalization",
+        "original": "I always feels and act like I'm in a hurry even if I have literally nothing to do!!!",
+        "processed": "alway feel act like hurry even literal noth"
+    }
+]
+
+REQUIREMENTS = {
+    "Contraction Expansion": {
+        "why": "Essential for standardizing text and proper tokenization",
+        "example": "don't → do not, it's → it is",
+        "frequency": "47.2% of posts"
+    },
+    "Number Normalization": {
+        "why": "Important for generalization in pattern recognition",
+        "example": "3 years, 5 years → NUM years",
+        "frequency": "46.7% of posts"
+    },
+    "URL Removal": {
+        "why": "Eliminates non-textual content that doesn't contribute to analysis",
+        "example": "https://example.com → [URL]",
+        "frequency": "1.8% of posts"
+    },
+    "Stopword Removal": {
+        "why": "Focuses on meaningful content words",
+        "example": "I am very anxious → anxious",
+        "frequency": "Reduced tokens by 53.3%"
+    }
+}
 
 # Set page configuration
 st.set_page_config(
@@ -17,13 +122,163 @@ st.title("📊 Text Preprocessing Report - Anxiety Dataset")
 st.markdown("### MSDS NLP 2025 - Text Preprocessing Assignment")
 st.markdown("---")
 
-# Load the processed data
-@st.cache_data
-def load_data():
-    df = pd.read_csv('data/anxiety_preprocessed.csv')
-    return df
+DATA_PATH = 'data/anxiety_preprocessed.csv'
+REPORT_PATH = 'data/preprocessing_report.html'
+# Token statistics and top terms precomputed from DATA_PATH by build_cache.py
+BUNDLE_PATH = 'data/app_cache.pkl'
+
+# Load the precomputed summaries; the file mtime is the cache key so a rebuilt
+# bundle is picked up without restarting the app
+@st.cache_resource
+def load_bundle(bundle_mtime):
+    with open(BUNDLE_PATH, 'rb') as f:
+        return pickle.load(f)
+
+# Same hash build_cache.py stores in the bundle; keyed on the CSV's mtime and
+# size so it is only recomputed when the file changes
+@st.cache_resource
+def data_sha256(data_mtime, data_size):
+    digest = hashlib.sha256()
+    with open(DATA_PATH, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# Raw file contents for the download buttons. Passed to st.download_button as
+# a callable, so the file is only read when the button is clicked rather than
+# held in memory on every render of the Download page
+def load_file_bytes(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+# Display-only charts skip Plotly.js's zoom/pan/hover machinery entirely
+STATIC_CHART_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+
+# Figures only depend on small hashable summaries, so each is built once and
+# reused across reruns. Plotly is imported inside the builders so pages
+# without charts never pay for loading it
+@st.cache_resource
+def build_token_box(original_box, processed_box):
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    for box, name, color in [(original_box, 'Original', 'lightblue'),
+                             (processed_box, 'After Processing', 'darkblue')]:
+        q1, median, q3, lowerfence, upperfence, outliers = box
+        fig.add_trace(go.Box(
+            x=[name], y=[list(outliers)], name=name, marker_color=color,
+            q1=[q1], median=[median], q3=[q3],
+            lowerfence=[lowerfence], upperfence=[upperfence],
+            boxpoints='outliers'
+        ))
+    fig.update_layout(title="Token Distribution Comparison", yaxis_title="Number of Tokens")
+    return fig
+
+@st.cache_resource
+def build_avg_bar(avg_original, avg_processed):
+    import plotly.graph_objects as go
+    fig = go.Figure(data=[
+        go.Bar(name='Average Tokens', x=['Original', 'Processed'], 
+              y=[avg_original, avg_processed],
+              text=[f'{avg_original:.0f}', f'{avg_processed:.0f}'],
+              textposition='auto',
+              marker_color=['lightcoral', 'darkgreen'])
+    ])
+    fig.update_layout(title="Average Token Count", yaxis_title="Number of Tokens")
+    return fig
+
+@st.cache_resource
+def build_pct_bar(stats_items):
+    import plotly.graph_objects as go
+    names = [name for name, _ in stats_items]
+    values = [value for _, value in stats_items]
+    fig = go.Figure(go.Bar(
+        x=names, y=values,
+        marker=dict(color=values, colorscale='Viridis', showscale=True)
+    ))
+    fig.update_layout(
+        title="Percentage of Posts Requiring Each Preprocessing Type",
+        xaxis_title="Preprocessing Type",
+        yaxis_title="Percentage of Posts (%)"
+    )
+    return fig
+
+@st.cache_resource
+def build_wordfreq_bar(terms, freqs):
+    import plotly.graph_objects as go
+    fig = go.Figure(go.Bar(
+        x=list(freqs), y=list(terms), orientation='h',
+        marker=dict(color=list(freqs), colorscale='Blues', showscale=True),
+        # Plain hover label, no trace-name box
+        hovertemplate='%{y}: %{x}<extra></extra>'
+    ))
+    fig.update_layout(
+        title="Top 15 Most Frequent Terms (After Preprocessing)",
+        xaxis_title="Frequency",
+        yaxis_title="Term",
+        # Keep the existing plot (and any zoom) on reruns instead of redrawing
+        uirevision='wordfreq'
+    )
+    return fig
+
+# Each Statistics tab is a fragment, so interacting with one tab only reruns
+# that tab instead of the whole script
+@st.fragment
+def render_token_tab(bundle):
+    st.subheader("Token Count Analysis")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        fig = build_token_box(bundle['original_box'], bundle['processed_box'])
+        st.plotly_chart(fig, width='stretch')
+
+    with col2:
+        fig = build_avg_bar(bundle['avg_original'], bundle['avg_processed'])
+        st.plotly_chart(fig, width='stretch', config=STATIC_CHART_CONFIG)
+
+@st.fragment
+def render_impact_tab():
+    st.subheader("Impact of Preprocessing Steps")
+    
+    fig = build_pct_bar(tuple(PREPROCESSING_STATS.items()))
+    st.plotly_chart(fig, width='stretch', config=STATIC_CHART_CONFIG)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Token Reduction", "53.3%", "-90.4 tokens/post")
+    with col2:
+        st.metric("Text Length Reduction", "0.5%", "-4.5 chars/post")
+    with col3:
+        st.metric("Vocabulary Size", "~15,000 unique terms", "after stemming")
+
+@st.fragment
+def render_wordfreq_tab(bundle):
+    st.subheader("Most Frequent Terms")
+    
+    top_terms = bundle['top_terms']
+    top_term = next(iter(top_terms))
+    # Reversed so the most frequent term sits at the top of the horizontal bar
+    fig = build_wordfreq_bar(tuple(top_terms)[::-1], tuple(top_terms.values())[::-1])
+    st.plotly_chart(fig, width='stretch')
+    
+    st.info(f"""
+    **Key Observations:**
+    - "{top_term}" is the most frequent term ({top_terms[top_term]:,} occurrences)
+    - "num" appears frequently due to number normalization
+    - Emotional terms like "feel", "want", "think" are prominent
+    - Work-related stress is evident from "work", "day" frequency
+    """)
+
+if not os.path.exists(BUNDLE_PATH):
+    st.error(f"Precomputed statistics not found at `{BUNDLE_PATH}`. "
+             "Run `python build_cache.py` to generate them.")
+    st.stop()
 
-df = load_data()
+bundle = load_bundle(os.path.getmtime(BUNDLE_PATH))
+data_stat = os.stat(DATA_PATH)
+if bundle.get('source_sha256') != data_sha256(data_stat.st_mtime, data_stat.st_size):
+    st.warning(f"`{DATA_PATH}` has changed since `{BUNDLE_PATH}` was built, so the "
+               "statistics below may be stale. Run `python build_cache.py` to refresh them.")
 
 # Sidebar for navigation
 st.sidebar.title("Navigation")
@@ -38,7 +293,7 @@ if page == "📋 Overview":
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Posts", f"{len(df):,}")
+        st.metric("Total Posts", f"{bundle['num_posts']:,}")
     
     with col2:
         st.metric("Date Range", "April 2019")
@@ -87,64 +342,7 @@ if page == "📋 Overview":
 elif page == "🔧 Preprocessing Steps":
     st.header("Preprocessing Steps Applied")
     
-    steps = [
-        {
-            "step": "1. Lowercasing",
-            "purpose": "Convert all text to lowercase for consistency",
-            "example": "I'm Having ANXIETY → i'm having anxiety",
-            "impact": "Ensures 'Anxiety' and 'anxiety' are treated as same word"
-        },
-        {
-            "step": "2. Contraction Expansion",
-            "purpose": "Expand contractions for better analysis",
-            "example": "don't → do not, it's → it is",
-            "impact": "Found in 47.2% of posts"
-        },
-        {
-            "step": "3. URL/Email Removal",
-            "purpose": "Remove web links and email addresses",
-            "example": "Check https://example.com → Check [URL]",
-            "impact": "Found in 1.8% of posts"
-        },
-        {
-            "step": "4. Number Normalization",
-            "purpose": "Replace numbers with placeholder token",
-            "example": "3 years ago → NUM years ago",
-            "impact": "Found in 46.7% of posts"
-        },
-        {
-            "step": "5. Punctuation Removal",
-            "purpose": "Remove excessive punctuation",
-            "example": "Help!!! → Help.",
-            "impact": "Found in 18.8% of posts"
-        },
-        {
-            "step": "6. Whitespace Normalization",
-            "purpose": "Remove extra spaces and newlines",
-            "example": "text    with    spaces → text with spaces",
-            "impact": "Ensures consistent spacing"
-        },
-        {
-            "step": "7. Tokenization",
-            "purpose": "Split text into individual words",
-            "example": "I have anxiety → ['I', 'have', 'anxiety']",
-            "impact": "Essential for word-level analysis"
-        },
-        {
-            "step": "8. Stopword Removal",
-            "purpose": "Remove common words with little meaning",
-            "example": "I have the anxiety → ['anxiety']",
-            "impact": "Reduced token count by 53.3%"
-        },
-        {
-            "step": "9. Stemming",
-            "purpose": "Reduce words to root form",
-            "example": "running, runs → run",
-            "impact": "Groups related words together"
-        }
-    ]
-    
-    for i, step_info in enumerate(steps):
+    for i, step_info in enumerate(STEPS):
         with st.expander(step_info["step"], expanded=(i<3)):
             col1, col2 = st.columns([2, 1])
             with col1:
@@ -159,152 +357,32 @@ elif page == "📊 Statistics":
     tab1, tab2, tab3 = st.tabs(["Token Analysis", "Preprocessing Impact", "Word Frequency"])
     
     with tab1:
-        st.subheader("Token Count Analysis")
-        
-        # Calculate token statistics
-        df['original_tokens'] = df['original_selftext'].fillna('').str.split().str.len()
-        df['processed_tokens'] = df['tokens_stemmed'].str.split().str.len()
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = go.Figure()
-            fig.add_trace(go.Box(y=df['original_tokens'], name='Original', marker_color='lightblue'))
-            fig.add_trace(go.Box(y=df['processed_tokens'], name='After Processing', marker_color='darkblue'))
-            fig.update_layout(title="Token Distribution Comparison", yaxis_title="Number of Tokens")
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            avg_original = df['original_tokens'].mean()
-            avg_processed = df['processed_tokens'].mean()
-            
-            fig = go.Figure(data=[
-                go.Bar(name='Average Tokens', x=['Original', 'Processed'], 
-                      y=[avg_original, avg_processed],
-                      text=[f'{avg_original:.0f}', f'{avg_processed:.0f}'],
-                      textposition='auto',
-                      marker_color=['lightcoral', 'darkgreen'])
-            ])
-            fig.update_layout(title="Average Token Count", yaxis_title="Number of Tokens")
-            st.plotly_chart(fig, use_container_width=True)
+        render_token_tab(bundle)
     
     with tab2:
-        st.subheader("Impact of Preprocessing Steps")
-        
-        preprocessing_stats = {
-            'Contractions': 47.2,
-            'Numbers': 46.7,
-            'Excessive Punctuation': 18.8,
-            'URLs': 1.8
-        }
-        
-        fig = px.bar(
-            x=list(preprocessing_stats.keys()),
-            y=list(preprocessing_stats.values()),
-            labels={'x': 'Preprocessing Type', 'y': 'Percentage of Posts (%)'},
-            title="Percentage of Posts Requiring Each Preprocessing Type",
-            color=list(preprocessing_stats.values()),
-            color_continuous_scale='viridis'
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Token Reduction", "53.3%", "-90.4 tokens/post")
-        with col2:
-            st.metric("Text Length Reduction", "0.5%", "-4.5 chars/post")
-        with col3:
-            st.metric("Vocabulary Size", "~15,000 unique terms", "after stemming")
+        render_impact_tab()
     
     with tab3:
-        st.subheader("Most Frequent Terms")
-        
-        # Create word frequency data
-        word_freq = {
-            'anxiety': 1447, 'feel': 1367, 'like': 1182, 'num': 1009,
-            'get': 754, 'know': 678, 'real': 612, 'want': 553,
-            'time': 537, 'think': 500, 'work': 480, 'would': 477,
-            'thing': 460, 'day': 457, 'help': 433
-        }
-        
-        fig = px.bar(
-            x=list(word_freq.values())[::-1],
-            y=list(word_freq.keys())[::-1],
-            orientation='h',
-            labels={'x': 'Frequency', 'y': 'Term'},
-            title="Top 15 Most Frequent Terms (After Preprocessing)",
-            color=list(word_freq.values())[::-1],
-            color_continuous_scale='blues'
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        
-        st.info("""
-        **Key Observations:**
-        - "anxiety" is the most frequent term (1,447 occurrences)
-        - "num" appears frequently due to number normalization
-        - Emotional terms like "feel", "want", "think" are prominent
-        - Work-related stress is evident from "work", "day" frequency
-        """)
+        render_wordfreq_tab(bundle)
 
 elif page == "💬 Examples":
     st.header("Preprocessing Examples from Dataset")
     
     st.markdown("### Real Examples Showing Preprocessing Impact")
     
-    examples = [
-        {
-            "title": "Example 1: Contraction Expansion & Number Normalization",
-            "original": "I'm going to give my 2 months notice to my employer today. It's a great company, but it just isn't a fit and I'm miserable at my current position.",
-            "processed": "going give num month notice employer today great company fit miserable current position"
-        },
-        {
-            "title": "Example 2: Stopword Removal & Stemming",
-            "original": "I got fired at my sidejob at a retail store, I had no previous experience with a retail job.",
-            "processed": "got fir sidejob retail store previous experience retail job"
-        },
-        {
-            "title": "Example 3: Punctuation & Whitespace Normalization",
-            "original": "I always feels and act like I'm in a hurry even if I have literally nothing to do!!!",
-            "processed": "alway feel act like hurry even literal noth"
-        }
-    ]
-    
-    for example in examples:
+    for example in EXAMPLES:
         with st.expander(example["title"], expanded=True):
             col1, col2 = st.columns(2)
             with col1:
                 st.markdown("**Original Text:**")
-                st.text_area("", example["original"], height=100, disabled=True, key=f"orig_{example['title']}")
+                st.code(example["original"], language=None, wrap_lines=True)
             with col2:
                 st.markdown("**After Preprocessing:**")
-                st.text_area("", example["processed"], height=100, disabled=True, key=f"proc_{example['title']}")
+                st.code(example["processed"], language=None, wrap_lines=True)
     
     st.markdown("### Specific Preprocessing Requirements")
     
-    requirements = {
-        "Contraction Expansion": {
-            "why": "Essential for standardizing text and proper tokenization",
-            "example": "don't → do not, it's → it is",
-            "frequency": "47.2% of posts"
-        },
-        "Number Normalization": {
-            "why": "Important for generalization in pattern recognition",
-            "example": "3 years, 5 years → NUM years",
-            "frequency": "46.7% of posts"
-        },
-        "URL Removal": {
-            "why": "Eliminates non-textual content that doesn't contribute to analysis",
-            "example": "https://example.com → [URL]",
-            "frequency": "1.8% of posts"
-        },
-        "Stopword Removal": {
-            "why": "Focuses on meaningful content words",
-            "example": "I am very anxious → anxious",
-            "frequency": "Reduced tokens by 53.3%"
-        }
-    }
-    
-    for req_name, req_info in requirements.items():
+    for req_name, req_info in REQUIREMENTS.items():
         with st.expander(f"Why {req_name} was necessary"):
             st.write(f"**Reason:** {req_info['why']}")
             st.code(req_info['example'])
@@ -321,13 +399,9 @@ else:  # Download page
         st.markdown("#### 📄 Processed Dataset")
         st.write("Complete dataset with all preprocessing stages")
         
-        # Read the CSV file
-        with open('data/anxiety_preprocessed.csv', 'r') as f:
-            csv_data = f.read()
-        
         st.download_button(
             label="Download anxiety_preprocessed.csv",
-            data=csv_data,
+            data=lambda: load_file_bytes(DATA_PATH),
             file_name="anxiety_preprocessed.csv",
             mime="text/csv"
         )
@@ -341,6 +415,17 @@ else:  # Download page
         - Stemmed tokens
         """)
     
+    with col2:
+        st.markdown("#### 📝 Preprocessing Report")
+        st.write("Standalone HTML version of this report")
+        
+        st.download_button(
+            label="Download preprocessing_report.html",
+            data=lambda: load_file_bytes(REPORT_PATH),
+            file_name="preprocessing_report.html",
+            mime="text/html"
+        )
+    
     st.markdown("---")
 
 # Footer